@@ -1,56 +1,112 @@
 """The Kiln Monitor integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 
-from .const import DOMAIN, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, SETTINGS_URL
-from .coordinator import KilnDataCoordinator
+from .const import (
+    DATA_SESSION,
+    DATA_SESSION_UNSUB,
+    DOMAIN,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    SETTINGS_URL,
+    UPDATE_JITTER_SECONDS,
+)
+from .coordinator import (
+    KilnAccountStore,
+    KilnAuth,
+    KilnDataCoordinator,
+    KilnFleetFetcher,
+    async_close_session,
+    async_get_session,
+    json_loads,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+# Fields of a kiln's settings needed to set up its coordinator
+_KILN_INFO_KEYS = ("kiln_id", "serial_number", "name")
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Kiln Monitor from a config entry."""
-    session = async_get_clientsession(hass)
+    session = async_get_session(hass)
     
     # Get update interval from options or use default
     update_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
     
-    # First, get all kilns for this account
-    try:
-        kilns = await _fetch_all_kilns(hass, session, entry.data)
-    except Exception as exc:
-        _LOGGER.error("Failed to fetch kiln list: %s", exc)
-        raise ConfigEntryNotReady(f"Could not fetch kiln list: {exc}") from exc
+    # The token and kiln list are persisted so a restart needs neither a fresh
+    # login nor a kiln list fetch before the first data fetch
+    storage = KilnAccountStore(hass, entry.entry_id)
+    await storage.async_load()
+    
+    # One token and one fetcher serve every kiln on this account
+    auth = KilnAuth(hass, entry, session, storage)
+    fleet = KilnFleetFetcher(session, auth)
     
-    if not kilns:
-        _LOGGER.error("No kilns found for this account")
-        raise ConfigEntryNotReady("No kilns found for this account")
+    # First, get all kilns for this account
+    if cached_kilns := storage.data.get("kilns"):
+        kilns = cached_kilns
+    else:
+        try:
+            kilns = await _fetch_all_kilns(session, auth)
+        except ConfigEntryAuthFailed:
+            raise
+        except Exception as exc:
+            _LOGGER.error("Failed to fetch kiln list: %s", exc)
+            raise ConfigEntryNotReady(f"Could not fetch kiln list: {exc}") from exc
+        
+        if not kilns:
+            _LOGGER.error("No kilns found for this account")
+            raise ConfigEntryNotReady("No kilns found for this account")
+        
+        await storage.async_update(kilns=kilns)
     
     _LOGGER.info("Found %d kiln(s) for account", len(kilns))
     
+    fleet.set_kilns(kilns)
+    
+    # Offset this account's polling from other accounts. Its own kilns share
+    # the same offset so their refreshes still coalesce into one fleet fetch.
+    interval_jitter = timedelta(
+        seconds=random.uniform(-UPDATE_JITTER_SECONDS, UPDATE_JITTER_SECONDS)
+    )
+    
     # Create a coordinator for each kiln
-    coordinators = []
-    for kiln_info in kilns:
-        coordinator = KilnDataCoordinator(
+    coordinators = [
+        KilnDataCoordinator(
             hass, 
-            session, 
-            entry.data, 
+            fleet, 
             update_interval_minutes=update_interval,
-            kiln_info=kiln_info
+            kiln_info=kiln_info,
+            interval_jitter=interval_jitter
         )
-        
-        await coordinator.async_config_entry_first_refresh()
-        coordinators.append(coordinator)
-        
+        for kiln_info in kilns
+    ]
+    
+    # Run the first refresh for all kilns concurrently so setup time
+    # doesn't grow with the number of kilns
+    try:
+        await asyncio.gather(
+            *(coordinator.async_config_entry_first_refresh() for coordinator in coordinators)
+        )
+    except ConfigEntryNotReady:
+        # The stored kiln list may be stale; fetch it again on the next attempt
+        if cached_kilns:
+            await storage.async_update(kilns=None)
+        raise
+    
+    for kiln_info in kilns:
         _LOGGER.info(
             "Set up coordinator for kiln: %s (Serial: %s)", 
             kiln_info.get("name", "Unknown"), 
@@ -65,60 +121,89 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    # Check the stored kiln list in the background so kilns added to or removed
+    # from the account are still picked up
+    if cached_kilns:
+        entry.async_create_background_task(
+            hass,
+            _async_refresh_kiln_list(hass, entry, session, auth, storage),
+            f"{DOMAIN} kiln list refresh",
+        )
+    
     return True
 
 
-async def _fetch_all_kilns(hass: HomeAssistant, session, config_data: dict) -> list[dict]:
-    """Fetch list of all kilns for the account."""
-    from .coordinator import KilnDataCoordinator
-    
-    # Create a temporary coordinator just to authenticate and get kiln list
-    temp_coordinator = KilnDataCoordinator(hass, session, config_data)
-    
-    # Authenticate
-    await temp_coordinator._ensure_authenticated()
-    
-    # Fetch settings to get all kilns
-    settings_headers = {
-        "content-type": "application/json",
-        "accept": "application/json",
-        "auth-token": f"binst-cookie={temp_coordinator.token}",
-        "kaid-version": "kaid-plus",
-        "sec-fetch-site": "cross-site",
-        "accept-language": "en-US,en;q=0.9",
-        "x-app-name-token": "kiln-aid",
-        "sec-fetch-mode": "cors",
-        "origin": "ionic://localhost",
-        "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
-        "email": temp_coordinator.email,
-        "sec-fetch-dest": "empty"
-    }
-    
-    async with session.post(
-        SETTINGS_URL, 
-        headers=settings_headers, 
-        json={},
-        timeout=30
-    ) as resp:
-        if resp.status != 200:
-            raise Exception(f"Failed to fetch kiln settings: status {resp.status}")
+async def _async_refresh_kiln_list(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    session,
+    auth: KilnAuth,
+    storage: KilnAccountStore,
+) -> None:
+    """Fetch the kiln list and reload the entry if it no longer matches the stored one."""
+    try:
+        kilns = await _fetch_all_kilns(session, auth)
+    except Exception as exc:  # pylint: disable=broad-except
+        _LOGGER.debug("Could not refresh kiln list: %s", exc)
+        return
+    
+    if not kilns or kilns == storage.data.get("kilns"):
+        return
+    
+    _LOGGER.info("Kiln list for account changed, reloading")
+    await storage.async_update(kilns=kilns)
+    hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
+async def _fetch_all_kilns(session, auth: KilnAuth) -> list[dict]:
+    """Fetch list of all kilns for the account, keeping the fields used to set them up."""
+    # Retry once with a fresh token if the shared one has expired
+    for attempt in range(2):
+        token = await auth.get_token()
         
-        settings_data = await resp.json()
+        # The settings endpoint takes an empty JSON object; send it pre-encoded
+        async with session.post(
+            SETTINGS_URL, 
+            headers=auth.headers, 
+            data=b"{}",
+        ) as resp:
+            if resp.status == 401 and attempt == 0:
+                auth.invalidate(token)
+                _LOGGER.debug("Token expired during kiln list fetch, re-authenticating")
+                continue
+            if resp.status != 200:
+                raise Exception(f"Failed to fetch kiln settings: status {resp.status}")
+            
+            settings_data = await resp.json(loads=json_loads)
+            break
     
     if not isinstance(settings_data, list):
         raise Exception("Invalid settings response format")
     
-    return settings_data
+    return [
+        {key: kiln[key] for key in _KILN_INFO_KEYS if key in kiln}
+        for kiln in settings_data
+    ]
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        domain_data = hass.data[DOMAIN]
+        domain_data.pop(entry.entry_id)
+        
+        # Close the shared session once the last entry is gone
+        if not domain_data.keys() - {DATA_SESSION, DATA_SESSION_UNSUB}:
+            await async_close_session(hass)
     
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored account state when a config entry is deleted."""
+    await KilnAccountStore(hass, entry.entry_id).async_remove()
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update listener for options changes."""
     coordinators: list[KilnDataCoordinator] = hass.data[DOMAIN][entry.entry_id]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
@@ -9,9 +10,9 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, LOGIN_URL, CONF_EMAIL, CONF_PASSWORD, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+from .const import DOMAIN, LOGIN_HEADERS, LOGIN_URL, CONF_EMAIL, CONF_PASSWORD, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+from .coordinator import async_get_session, json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,37 +26,34 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    session = async_get_clientsession(hass)
+    # Use the integration's session so setup can reuse this connection
+    session = async_get_session(hass)
     
-    login_headers = {
-        "Accept": "application/json",
-        "kaid-version": "kaid-plus",
-        "Sec-Fetch-Site": "cross-site",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Sec-Fetch-Mode": "cors",
-        "Content-Type": "application/json",
-        "Origin": "ionic://localhost",
-        "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
-        "Connection": "keep-alive",
-        "Sec-Fetch-Dest": "empty"
-    }
-
     login_payload = {
         "email": data[CONF_EMAIL],
         "password": data[CONF_PASSWORD]
     }
 
     try:
-        async with session.post(LOGIN_URL, headers=login_headers, json=login_payload) as resp:
-            if resp.status != 200:
+        async with session.post(
+            LOGIN_URL, headers=LOGIN_HEADERS, json=login_payload
+        ) as resp:
+            # Only a rejected login means bad credentials; anything else,
+            # such as 429 or 5xx, is a problem reaching the service
+            if resp.status in (401, 403):
                 raise InvalidAuth(f"Login failed with status {resp.status}")
+            if resp.status != 200:
+                _LOGGER.error("Login failed with status %s", resp.status)
+                raise CannotConnect(f"Login failed with status {resp.status}")
             
-            auth_data = await resp.json()
+            auth_data = await resp.json(loads=json_loads)
             token = auth_data.get("authentication_token")
             
             if not token:
                 raise InvalidAuth("Authentication token not found in response")
                 
+    except (InvalidAuth, CannotConnect):
+        raise
     except Exception as exc:
         _LOGGER.error("Failed to authenticate: %s", exc)
         raise CannotConnect from exc
@@ -76,6 +74,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         
         if user_input is not None:
+            # Create a unique ID based on email to prevent duplicate entries.
+            # Done before validating so a duplicate aborts without a login request.
+            await self.async_set_unique_id(user_input[CONF_EMAIL])
+            self._abort_if_unique_id_configured()
+            
             try:
                 info = await validate_input(self.hass, user_input)
             except CannotConnect:
@@ -86,16 +89,48 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                # Create a unique ID based on email to prevent duplicate entries
-                await self.async_set_unique_id(user_input[CONF_EMAIL])
-                self._abort_if_unique_id_configured()
-                
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_reauth(
+        self, entry_data: Mapping[str, Any]
+    ) -> FlowResult:
+        """Handle reauthentication when the stored credentials stop working."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask for a new password for the existing account."""
+        errors: dict[str, str] = {}
+        entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        
+        if user_input is not None:
+            data = {**entry.data, CONF_PASSWORD: user_input[CONF_PASSWORD]}
+            try:
+                await validate_input(self.hass, data)
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            except InvalidAuth:
+                errors["base"] = "invalid_auth"
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                self.hass.config_entries.async_update_entry(entry, data=data)
+                await self.hass.config_entries.async_reload(entry.entry_id)
+                return self.async_abort(reason="reauth_successful")
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema({vol.Required(CONF_PASSWORD): str}),
+            description_placeholders={"email": entry.data[CONF_EMAIL]},
+            errors=errors,
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(
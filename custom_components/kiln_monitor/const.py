@@ -1,13 +1,62 @@
 """Constants for the Kiln Monitor integration."""
-from datetime import timedelta
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial, reduce
+from operator import getitem
+from types import MappingProxyType
+from typing import Any
+
+from aiohttp import ClientTimeout
 
 DOMAIN = "kiln_monitor"
 
+# Key in hass.data[DOMAIN] for the HTTP session shared by all entries
+DATA_SESSION = "_session"
+# Key for removing that session's shutdown listener when it is closed early
+DATA_SESSION_UNSUB = "_session_unsub"
+
+# Persistent storage for the auth token and kiln list, one file per config entry
+STORAGE_KEY = f"{DOMAIN}.account"
+STORAGE_VERSION = 1
+
 # API URLs
 LOGIN_URL = "https://bartinst-user-service-prod.herokuapp.com/login"
 SETTINGS_URL = "https://kiln.bartinst.com/kilns/settings"
 DATA_URL = "https://kiln.bartinst.com/kilns/data"
 
+# Fail fast on stalled connects and reads instead of spending the whole budget on them
+FAST_TIMEOUT = ClientTimeout(total=30, connect=5, sock_connect=5, sock_read=15)
+
+# Static request headers, built once and shared by every request
+USER_AGENT = "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148"
+
+LOGIN_HEADERS = MappingProxyType({
+    "Accept": "application/json",
+    "kaid-version": "kaid-plus",
+    "Sec-Fetch-Site": "cross-site",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Sec-Fetch-Mode": "cors",
+    "Content-Type": "application/json",
+    "Origin": "ionic://localhost",
+    "User-Agent": USER_AGENT,
+    "Connection": "keep-alive",
+    "Sec-Fetch-Dest": "empty"
+})
+
+# Headers for authenticated requests; "auth-token" and "email" are added per call
+BASE_DATA_HEADERS = MappingProxyType({
+    "content-type": "application/json",
+    "accept": "application/json",
+    "kaid-version": "kaid-plus",
+    "sec-fetch-site": "cross-site",
+    "accept-language": "en-US,en;q=0.9",
+    "x-app-name-token": "kiln-aid",
+    "sec-fetch-mode": "cors",
+    "origin": "ionic://localhost",
+    "user-agent": USER_AGENT,
+    "sec-fetch-dest": "empty"
+})
+
 # Configuration keys
 CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
@@ -15,48 +64,93 @@ CONF_UPDATE_INTERVAL = "update_interval"
 
 # Default values
 DEFAULT_UPDATE_INTERVAL = 5  # minutes
-SCAN_INTERVAL = timedelta(minutes=DEFAULT_UPDATE_INTERVAL)
+
+# Data fetched for an account is shared between its kilns for this long
+FLEET_CACHE_SECONDS = 10
+
+# Backoff before retrying after a transient API error
+RETRY_BASE_DELAY = 1  # seconds
+RETRY_MAX_DELAY = 30  # seconds
+# Quick retries before waiting for the next regular refresh. A whole burst of
+# them counts as a single failure towards the soft-failure and penalty limits.
+RETRY_ATTEMPTS = 4
+
+# Refresh interval after repeated failures, growing with each failure up to a cap
+FAILURE_PENALTY_STEP = 15  # minutes
+FAILURE_PENALTY_MAX = 60  # minutes
+
+# Each account's polling interval is offset by up to this much so accounts
+# don't all refresh in the same instant
+UPDATE_JITTER_SECONDS = 15
+
+
+def _chain(*keys: str) -> Callable[[dict[str, Any]], Any]:
+    """Build a getter that walks nested dicts along keys.
+
+    The walk is reduce(getitem, keys, data), so it runs without a Python-level
+    loop. Raises KeyError or TypeError when a key along the path is missing.
+    """
+    return partial(reduce, getitem, keys)
+
+
+@dataclass(frozen=True, slots=True)
+class SensorSpec:
+    """Description of a kiln sensor."""
+
+    key: str
+    name: str
+    unit: str | None
+    device_class: str | None
+    state_class: str | None
+    getter: Callable[[dict[str, Any]], Any]
+    value_type: type
+
 
 # Sensor definitions
-SENSORS = {
-    "temperature": {
-        "name": "Temperature",
-        "unit": "°F",
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "data_path": ["list", "temperature"],
-        "value_type": float,
-    },
-    "kilnStatus": {
-        "name": "Status",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "data_path": ["list", "kilnStatus"],
-        "value_type": str,
-    },
-    "firmwareVersion": {
-        "name": "Firmware Version",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "data_path": ["settings", "firmwareVersion"],
-        "value_type": str,
-    },
-    "numFirings": {
-        "name": "Number of Firings",
-        "unit": "firings",
-        "device_class": None,
-        "state_class": "total",
-        "data_path": ["settings", "numFirings"],
-        "value_type": int,
-    },
-    "numZones": {
-        "name": "Zone Count",
-        "unit": "zones",
-        "device_class": None,
-        "state_class": "total",
-        "data_path": ["settings", "numZones"],
-        "value_type": int,
-    },
-}
\ No newline at end of file
+SENSORS: tuple[SensorSpec, ...] = (
+    SensorSpec(
+        key="temperature",
+        name="Temperature",
+        unit="°F",
+        device_class="temperature",
+        state_class="measurement",
+        getter=_chain("list", "temperature"),
+        value_type=float,
+    ),
+    SensorSpec(
+        key="kilnStatus",
+        name="Status",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        getter=_chain("list", "kilnStatus"),
+        value_type=str,
+    ),
+    SensorSpec(
+        key="firmwareVersion",
+        name="Firmware Version",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        getter=_chain("settings", "firmwareVersion"),
+        value_type=str,
+    ),
+    SensorSpec(
+        key="numFirings",
+        name="Number of Firings",
+        unit="firings",
+        device_class=None,
+        state_class="total",
+        getter=_chain("settings", "numFirings"),
+        value_type=int,
+    ),
+    SensorSpec(
+        key="numZones",
+        name="Zone Count",
+        unit="zones",
+        device_class=None,
+        state_class="total",
+        getter=_chain("settings", "numZones"),
+        value_type=int,
+    ),
+)
@@ -5,127 +5,235 @@ import logging
 from datetime import timedelta
 from typing import Any
 import asyncio
+import json
+import random
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
 
-from homeassistant.core import HomeAssistant
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.ssl import client_context
 
 from .const import (
     DATA_URL,
     LOGIN_URL,
+    BASE_DATA_HEADERS,
+    LOGIN_HEADERS,
+    DATA_SESSION,
+    DATA_SESSION_UNSUB,
+    DOMAIN,
     CONF_EMAIL,
     CONF_PASSWORD,
     DEFAULT_UPDATE_INTERVAL,
+    FAILURE_PENALTY_MAX,
+    FAILURE_PENALTY_STEP,
+    FAST_TIMEOUT,
+    FLEET_CACHE_SECONDS,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    SENSORS,
+    STORAGE_KEY,
+    STORAGE_VERSION,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# orjson ships with Home Assistant and parses responses faster than the stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
-class KilnDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Class to manage fetching data from the Kiln API."""
+
+# Each sensor's getter and converter, with the converter picked once at import
+_SENSOR_EXTRACTORS = tuple(
+    (
+        spec.key,
+        spec.getter,
+        spec.value_type if spec.value_type in (float, int) else str,
+    )
+    for spec in SENSORS
+)
+
+
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the HTTP session shared by all Kiln Monitor entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session: aiohttp.ClientSession | None = domain_data.get(DATA_SESSION)
+    if session is not None and not session.closed:
+        return session
+
+    # Only two hosts are polled every few minutes, so keep a small pool whose
+    # keepalive spans the polling interval instead of re-handshaking TLS.
+    # Request bodies are serialized with Home Assistant's orjson-backed encoder,
+    # and every request gets the fail-fast timeout unless it passes its own.
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=10,
+            limit_per_host=4,
+            keepalive_timeout=600,
+            ttl_dns_cache=600,
+            ssl=client_context(),
+        ),
+        json_serialize=json_dumps,
+        timeout=FAST_TIMEOUT,
+    )
+    domain_data[DATA_SESSION] = session
+
+    async def _async_close_session(event: Event) -> None:
+        """Close the session when Home Assistant shuts down."""
+        domain_data.pop(DATA_SESSION_UNSUB, None)
+        await session.close()
+
+    # A listener left over from a session that was closed some other way
+    # would keep that session referenced
+    if (unsub := domain_data.pop(DATA_SESSION_UNSUB, None)) is not None:
+        unsub()
+    domain_data[DATA_SESSION_UNSUB] = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+    )
+    return session
+
+
+async def async_close_session(hass: HomeAssistant) -> None:
+    """Close the shared HTTP session and remove its shutdown listener."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if (unsub := domain_data.pop(DATA_SESSION_UNSUB, None)) is not None:
+        unsub()
+    if (session := domain_data.pop(DATA_SESSION, None)) is not None:
+        await session.close()
+
+
+class KilnAccountStore:
+    """Persist account state, such as the token and kiln list, between restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}"
+        )
+        self.data: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored state."""
+        self.data = await self._store.async_load() or {}
+
+    async def async_update(self, **changes: Any) -> None:
+        """Update some stored values and save them."""
+        self.data.update(changes)
+        await self._store.async_save(self.data)
+
+    @callback
+    def async_schedule_update(self, **changes: Any) -> None:
+        """Update some stored values and save them shortly, without waiting."""
+        self.data.update(changes)
+        self._store.async_delay_save(lambda: self.data, 1)
+
+    async def async_remove(self) -> None:
+        """Remove the stored state."""
+        await self._store.async_remove()
+
+
+class KilnAuth:
+    """Hold one authentication token shared by everything on an account."""
 
     def __init__(
         self,
         hass: HomeAssistant,
+        entry: ConfigEntry,
         session,
-        config_data: dict[str, str],
-        update_interval_minutes: int = DEFAULT_UPDATE_INTERVAL,
-        kiln_info: dict[str, Any] | None = None,
+        storage: KilnAccountStore | None = None,
     ) -> None:
         """Initialize."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="Kiln API",
-            update_interval=timedelta(minutes=update_interval_minutes),
-        )
+        self.hass = hass
+        self.entry = entry
         self.session = session
-        self.email = config_data[CONF_EMAIL]
-        self.password = config_data[CONF_PASSWORD]
-        self.token: str | None = None
-        
-        # If kiln_info is provided, use it; otherwise these will be set during first fetch
-        if kiln_info:
-            self.kiln_id: str | None = kiln_info.get("kiln_id")
-            self.serial_number: str | None = kiln_info.get("serial_number")
-            self.kiln_name: str | None = kiln_info.get("name", "Kiln")
-        else:
-            self.kiln_id: str | None = None
-            self.serial_number: str | None = None
-            self.kiln_name: str | None = None
-            
-        self._consecutive_failures = 0
-        self._max_retries = 3
-        self._retry_delay = 30  # seconds
+        self.email = entry.data[CONF_EMAIL]
+        self.password = entry.data[CONF_PASSWORD]
 
-    def update_interval_minutes(self, minutes: int) -> None:
-        """Update the refresh interval."""
-        self.update_interval = timedelta(minutes=minutes)
-        _LOGGER.debug("Update interval changed to %d minutes for kiln %s", 
-                     minutes, self.kiln_name)
+        # A token saved by a previous run is used until a request rejects it
+        self._storage = storage
+        self.token = storage.data.get("token") if storage else None
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via library."""
-        for attempt in range(self._max_retries):
-            try:
-                # Step 1: Ensure we have a valid token
-                await self._ensure_authenticated()
-                
-                # Step 2: Fetch kiln data
-                data = await self._fetch_kiln_data()
-                
-                # Reset failure counter on success
-                self._consecutive_failures = 0
-                return data
-                
-            except Exception as exc:
-                self._consecutive_failures += 1
-                _LOGGER.warning(
-                    "Attempt %d/%d failed for kiln %s data fetch: %s", 
-                    attempt + 1, self._max_retries, self.kiln_name, exc
-                )
-                
-                # If this is a 500 error or auth issue, try to re-authenticate
-                if "500" in str(exc) or "auth" in str(exc).lower():
-                    _LOGGER.info("Clearing token for kiln %s due to potential auth issue", 
-                               self.kiln_name)
-                    self.token = None
-                
-                # If this isn't the last attempt, wait and retry
-                if attempt < self._max_retries - 1:
-                    await asyncio.sleep(self._retry_delay)
-                    continue
-                
-                # If we've had too many consecutive failures, increase the update interval
-                if self._consecutive_failures >= 5:
-                    _LOGGER.warning(
-                        "Too many consecutive failures (%d) for kiln %s, temporarily increasing update interval",
-                        self._consecutive_failures, self.kiln_name
-                    )
-                    # Temporarily increase interval to reduce load
-                    self.update_interval = timedelta(minutes=max(15, self.update_interval.total_seconds() / 60))
-                
-                raise UpdateFailed(f"Kiln API error for {self.kiln_name} after {self._max_retries} attempts: {exc}") from exc
+        self._auth_task: asyncio.Task[str] | None = None
+
+    @property
+    def token(self) -> str | None:
+        """Return the current token."""
+        return self._token
+
+    @token.setter
+    def token(self, token: str | None) -> None:
+        """Set the token and rebuild the authenticated request headers for it."""
+        self._token = token
+        self.headers: Mapping[str, str] | None = (
+            MappingProxyType({
+                **BASE_DATA_HEADERS,
+                "auth-token": f"binst-cookie={token}",
+                "email": self.email,
+            })
+            if token
+            else None
+        )
+
+    def invalidate(self, token: str | None) -> None:
+        """Drop token if it is still the current one.
 
-    async def _ensure_authenticated(self) -> None:
-        """Ensure we have a valid authentication token."""
-        if not self.token:
-            await self._authenticate()
+        Callers pass the token their request was rejected with, so a late 401
+        doesn't discard a newer token another caller has already fetched.
+        """
+        if token is not None and token == self.token:
+            self.token = None
+            # Don't load the rejected token again on the next restart
+            if self._storage is not None and self._storage.data.get("token") == token:
+                self._storage.async_schedule_update(token=None)
+
+    async def get_token(self) -> str:
+        """Return a valid token, logging in only when there is none.
+
+        Only one login runs at a time; callers arriving while it is in flight
+        await the same task instead of sending their own login request. The
+        login runs in its own task, so a caller being cancelled doesn't abort it
+        for everyone else. The task belongs to the config entry, so unloading
+        the entry cancels it before it can write to the entry's storage.
+        """
+        if self.token:
+            return self.token
+        if self._auth_task is None:
+            self._auth_task = self.entry.async_create_background_task(
+                self.hass, self._async_acquire_token(), f"{DOMAIN} login"
+            )
+            self._auth_task.add_done_callback(self._auth_task_done)
+        return await asyncio.shield(self._auth_task)
+
+    @callback
+    def _auth_task_done(self, task: asyncio.Task[str]) -> None:
+        """Forget the finished login so the next expired token starts a new one."""
+        if self._auth_task is task:
+            self._auth_task = None
+        # Mark a failure as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_acquire_token(self) -> str:
+        """Log in and persist the new token for the next run."""
+        await self._authenticate()
+        if self._storage is not None:
+            await self._storage.async_update(token=self.token)
+        return self.token
 
     async def _authenticate(self) -> None:
         """Authenticate with the API and get token."""
-        login_headers = {
-            "Accept": "application/json",
-            "kaid-version": "kaid-plus",
-            "Sec-Fetch-Site": "cross-site",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Sec-Fetch-Mode": "cors",
-            "Content-Type": "application/json",
-            "Origin": "ionic://localhost",
-            "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
-            "Connection": "keep-alive",
-            "Sec-Fetch-Dest": "empty"
-        }
-
         login_payload = {
             "email": self.email,
             "password": self.password
@@ -134,81 +242,438 @@ class KilnDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         try:
             async with self.session.post(
                 LOGIN_URL, 
-                headers=login_headers, 
+                headers=LOGIN_HEADERS, 
                 json=login_payload,
-                timeout=30
             ) as resp:
                 if resp.status == 401:
-                    raise UpdateFailed("Invalid credentials - check email and password")
+                    raise ConfigEntryAuthFailed("Invalid credentials - check email and password")
                 elif resp.status == 429:
                     raise UpdateFailed("Rate limited - too many login attempts")
+                elif resp.status >= 500:
+                    raise ServerError(resp.status)
                 elif resp.status != 200:
                     raise UpdateFailed(f"Login failed with status {resp.status}")
                 
-                auth_data = await resp.json()
+                auth_data = await resp.json(loads=json_loads)
                 self.token = auth_data.get("authentication_token")
                 if not self.token:
                     raise UpdateFailed("Token not found in login response")
                     
-                _LOGGER.debug("Successfully authenticated with Kiln API for kiln %s", 
-                            self.kiln_name)
+                _LOGGER.debug("Successfully authenticated with Kiln API for %s", 
+                            self.email)
                 
+        except ConfigEntryAuthFailed:
+            raise
         except asyncio.TimeoutError:
-            raise UpdateFailed("Login request timed out")
+            raise RequestTimedOut("Login request timed out")
+        except ServerError:
+            # Transient; the coordinator decides when a streak is worth a warning
+            raise
+        except UpdateFailed as exc:
+            # Keep the specific error type so callers can tell failures apart
+            _LOGGER.error("Authentication failed for %s: %s", self.email, exc)
+            raise
+        except aiohttp.ClientError as exc:
+            _LOGGER.debug("Authentication failed for %s: %s", self.email, exc)
+            raise ConnectionFailed(f"Authentication error: {exc}") from exc
         except Exception as exc:
-            _LOGGER.error("Authentication failed for kiln %s: %s", self.kiln_name, exc)
+            _LOGGER.error("Authentication failed for %s: %s", self.email, exc)
             raise UpdateFailed(f"Authentication error: {exc}") from exc
 
-    async def _fetch_kiln_data(self) -> dict[str, Any]:
-        """Fetch kiln data using kiln_id."""
-        if not self.kiln_id:
-            raise UpdateFailed(f"No kiln_id available for kiln {self.kiln_name}")
-            
-        data_headers = {
-            "content-type": "application/json",
-            "accept": "application/json",
-            "auth-token": f"binst-cookie={self.token}",
-            "kaid-version": "kaid-plus",
-            "sec-fetch-site": "cross-site",
-            "accept-language": "en-US,en;q=0.9",
-            "x-app-name-token": "kiln-aid",
-            "sec-fetch-mode": "cors",
-            "origin": "ionic://localhost",
-            "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
-            "email": self.email,
-            "sec-fetch-dest": "empty"
-        }
 
-        data_payload = {
-            "externalIds": [self.kiln_id]
+class KilnFleetFetcher:
+    """Fetch data for every kiln on an account with a single request."""
+
+    def __init__(self, session, auth: KilnAuth) -> None:
+        """Initialize."""
+        self.session = session
+        self.auth = auth
+        self.set_kilns([])
+        self.coordinators: dict[str, KilnDataCoordinator] = {}
+
+        self._lock = asyncio.Lock()
+        self._data: dict[str, dict[str, Any]] = {}
+        self._fetched_at: float | None = None
+        self._error: Exception | None = None
+        self._failed_at: float | None = None
+        self._order_fallback_logged = False
+
+    @property
+    def kiln_ids(self) -> list[str]:
+        """Return the ids of the kilns fetched by this account."""
+        return self._kiln_ids
+
+    def set_kilns(self, kilns: list[dict[str, Any]]) -> None:
+        """Set the kilns to fetch and pre-encode the request body for them."""
+        self._kiln_ids = [kiln["kiln_id"] for kiln in kilns if kiln.get("kiln_id")]
+        self._kiln_id_by_serial = {
+            kiln["serial_number"]: kiln["kiln_id"]
+            for kiln in kilns
+            if kiln.get("kiln_id") and kiln.get("serial_number")
         }
+        self._data_body: bytes = json.dumps({"externalIds": self._kiln_ids}).encode()
+
+    def _match_kiln_id(self, entry: Any) -> str | None:
+        """Return the kiln_id a data entry belongs to, or None if it can't be told."""
+        if not isinstance(entry, dict):
+            return None
+        settings = entry.get("settings")
+        if not isinstance(settings, dict):
+            settings = {}
+        for kiln_id in (
+            entry.get("externalId"),
+            entry.get("kiln_id"),
+            settings.get("kiln_id"),
+        ):
+            if kiln_id in self._kiln_ids:
+                return kiln_id
+        return self._kiln_id_by_serial.get(
+            entry.get("serial_number") or settings.get("serial_number")
+        )
+
+    async def fetch_all(self, requester: str | None = None) -> dict[str, dict[str, Any]]:
+        """Return the latest data for all kilns, keyed by kiln_id.
+
+        A fresh result is pushed to every other registered coordinator, which
+        also pushes back their next scheduled refresh, so one coordinator ends
+        up polling for the whole account. A result fetched within
+        FLEET_CACHE_SECONDS is shared instead of issuing another request.
+        A fetch that failed while a caller waited for the lock is shared with
+        it as SharedFetchFailed, so sibling coordinators don't each repeat it.
+        """
+        requested_at = time.monotonic()
+        async with self._lock:
+            if (
+                self._fetched_at is not None
+                and time.monotonic() - self._fetched_at < FLEET_CACHE_SECONDS
+            ):
+                return self._data
+            if self._failed_at is not None and self._failed_at >= requested_at:
+                if isinstance(self._error, ConfigEntryAuthFailed):
+                    raise ConfigEntryAuthFailed(str(self._error)) from self._error
+                raise SharedFetchFailed(self._error)
+
+            try:
+                self._data = await self._fetch_kiln_data()
+            except Exception as exc:
+                self._error = exc
+                self._failed_at = time.monotonic()
+                raise
+            self._error = None
+            self._failed_at = None
+            self._fetched_at = time.monotonic()
+
+            for kiln_id, coordinator in self.coordinators.items():
+                if kiln_id != requester and kiln_id in self._data:
+                    coordinator.async_set_fleet_data(self._data[kiln_id])
+
+            return self._data
+
+    async def _fetch_kiln_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch data for all kilns in one request and index it by kiln_id."""
+        if not self.kiln_ids:
+            raise UpdateFailed("No kiln_ids available for this account")
 
         try:
-            async with self.session.post(
-                DATA_URL, 
-                headers=data_headers, 
-                json=data_payload,
-                timeout=30
-            ) as resp:
-                if resp.status == 401:
-                    # Token might be expired, clear it to force re-auth
-                    self.token = None
-                    raise UpdateFailed("Authentication token expired during data fetch")
-                elif resp.status == 404:
-                    # Kiln might not exist or be accessible
-                    raise UpdateFailed("Kiln not found - check if kiln is online")
-                elif resp.status == 500:
-                    raise UpdateFailed("Server error when fetching kiln data (status 500)")
-                elif resp.status != 200:
-                    raise UpdateFailed(f"Kiln data fetch failed with status {resp.status}")
-                
-                data = await resp.json()
+            # Retry once with a fresh token if the current one has expired
+            for attempt in range(2):
+                token = await self.auth.get_token()
+
+                async with self.session.post(
+                    DATA_URL, 
+                    headers=self.auth.headers, 
+                    data=self._data_body,
+                ) as resp:
+                    if resp.status == 401:
+                        self.auth.invalidate(token)
+                        if attempt == 0:
+                            _LOGGER.debug("Token expired during data fetch, re-authenticating")
+                            continue
+                        raise AuthExpired("Authentication token expired during data fetch")
+                    elif resp.status == 404:
+                        # Kiln might not exist or be accessible
+                        raise UpdateFailed("Kiln not found - check if kiln is online")
+                    elif resp.status >= 500:
+                        # Server errors are sometimes caused by a stale token.
+                        # Drop it only on the first one after a success, so
+                        # retries through an outage don't each log in again.
+                        if self._error is None:
+                            self.auth.invalidate(token)
+                        raise ServerError(resp.status)
+                    elif resp.status != 200:
+                        raise UpdateFailed(f"Kiln data fetch failed with status {resp.status}")
+                    
+                    data = await resp.json(loads=json_loads)
+                    break
 
             if not isinstance(data, list) or not data:
                 raise UpdateFailed("Empty or invalid kiln data response")
 
-            _LOGGER.debug("Successfully fetched data for kiln %s", self.kiln_name)
-            return data[0]
+            # Match entries to kilns by id rather than position. Kilns missing
+            # from the response fail on their own; the others still update.
+            by_kiln = {}
+            unmatched = 0
+            for entry in data:
+                if (kiln_id := self._match_kiln_id(entry)) is not None:
+                    by_kiln[kiln_id] = entry
+                else:
+                    unmatched += 1
+
+            if not by_kiln and len(data) == len(self.kiln_ids):
+                # No entry carries a known id, so rely on the API answering in
+                # request order
+                if not self._order_fallback_logged and len(data) > 1:
+                    self._order_fallback_logged = True
+                    _LOGGER.warning(
+                        "Kiln data entries carry no known id, matching them to kilns by request order"
+                    )
+                by_kiln = dict(zip(self.kiln_ids, data))
+            elif unmatched:
+                _LOGGER.warning(
+                    "Ignoring %d kiln data entry(ies) that match no known kiln", unmatched
+                )
+
+            _LOGGER.debug(
+                "Fetched data for %d of %d kiln(s)", len(by_kiln), len(self.kiln_ids)
+            )
+            return by_kiln
             
         except asyncio.TimeoutError:
-            raise UpdateFailed("Kiln data request timed out")
\ No newline at end of file
+            raise RequestTimedOut("Kiln data request timed out")
+        except aiohttp.ClientError as exc:
+            raise ConnectionFailed(f"Kiln data request failed: {exc}") from exc
+
+
+class KilnDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Class to manage fetching data from the Kiln API."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        fleet: KilnFleetFetcher,
+        update_interval_minutes: int = DEFAULT_UPDATE_INTERVAL,
+        kiln_info: dict[str, Any] | None = None,
+        interval_jitter: timedelta = timedelta(0),
+    ) -> None:
+        """Initialize."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="Kiln API",
+            update_interval=timedelta(minutes=update_interval_minutes) + interval_jitter,
+        )
+        self.fleet = fleet
+        self._interval_jitter = interval_jitter
+        self._base_interval = self.update_interval
+        
+        # If kiln_info is provided, use it; otherwise these will be set during first fetch
+        if kiln_info:
+            self.kiln_id: str | None = kiln_info.get("kiln_id")
+            self.serial_number: str | None = kiln_info.get("serial_number")
+            self.kiln_name: str | None = kiln_info.get("name", "Kiln")
+        else:
+            self.kiln_id: str | None = None
+            self.serial_number: str | None = None
+            self.kiln_name: str | None = None
+        
+        # Receive data fetched by the other kilns on this account
+        if self.kiln_id:
+            fleet.coordinators[self.kiln_id] = self
+            
+        self._consecutive_failures = 0
+        self._retries = 0
+        self._soft_failures = 0
+        self._max_soft_failures = 3
+        
+        # Whether the last update produced data, so sensors check a single flag
+        self.data_ok = False
+        
+        # Shared by every sensor of this kiln, rebuilt only when firmware changes
+        self._device_info: DeviceInfo | None = None
+
+    def update_interval_minutes(self, minutes: int) -> None:
+        """Update the refresh interval."""
+        self._base_interval = timedelta(minutes=minutes) + self._interval_jitter
+        self.update_interval = self._base_interval
+        _LOGGER.debug("Update interval changed to %d minutes for kiln %s", 
+                     minutes, self.kiln_name)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Update data via library."""
+        try:
+            if not self.kiln_id:
+                raise UpdateFailed(f"No kiln_id available for kiln {self.kiln_name}")
+            
+            # Data for the whole account is fetched in one shared request
+            fleet_data = await self.fleet.fetch_all(requester=self.kiln_id)
+            raw = fleet_data.get(self.kiln_id)
+            if raw is None:
+                raise UpdateFailed(f"No data returned for kiln {self.kiln_name}")
+            
+        except ConfigEntryAuthFailed:
+            # Let Home Assistant start the reauth flow instead of retrying
+            self.data_ok = False
+            raise
+        except Exception as exc:
+            # A sibling's fetch failed just now; only the coordinator that ran
+            # it retries quickly, the others wait for their regular refresh
+            shared = isinstance(exc, SharedFetchFailed)
+            if shared:
+                exc = exc.error
+            transient = isinstance(exc, (ConnectionFailed, RequestTimedOut, ServerError))
+            
+            # Retry transient errors sooner than the regular interval, backing
+            # off exponentially, and keep good last data meanwhile. The burst
+            # doesn't count towards the failure streak below.
+            if transient and not shared and self._retries < RETRY_ATTEMPTS:
+                self._retries += 1
+                self.update_interval = min(self._base_interval, self._retry_delay())
+                _LOGGER.debug(
+                    "Transient error for kiln %s, retry %d/%d in %s: %s",
+                    self.kiln_name, self._retries, RETRY_ATTEMPTS,
+                    self.update_interval, exc
+                )
+                # Only bridge the burst while the data is still considered good;
+                # once the soft-failure budget is spent, stay unavailable
+                if self.data_ok and self.data is not None:
+                    return self.data
+                self.data_ok = False
+                raise UpdateFailed(f"Kiln API error for {self.kiln_name}: {exc}") from exc
+            
+            # Anything else waits for the next regular refresh
+            self._retries = 0
+            self._consecutive_failures += 1
+            self.update_interval = self._base_interval
+            
+            # Transient errors are expected now and then, so they are only
+            # logged at debug level until a streak of them starts the penalty
+            if not transient:
+                _LOGGER.warning(
+                    "Data fetch failed for kiln %s: %s", self.kiln_name, exc
+                )
+            elif self._consecutive_failures == 5:
+                _LOGGER.warning(
+                    "Too many consecutive failures (%d) for kiln %s, temporarily increasing update interval: %s",
+                    self._consecutive_failures, self.kiln_name, exc
+                )
+            else:
+                _LOGGER.debug(
+                    "Transient error %d for kiln %s: %s",
+                    self._consecutive_failures, self.kiln_name, exc
+                )
+            
+            # Keep serving the last good data through a few transient errors so
+            # a flaky API doesn't mark every sensor unavailable
+            if (
+                transient
+                and self.data is not None
+                and self._soft_failures < self._max_soft_failures
+            ):
+                self._soft_failures += 1
+                return self.data
+            
+            # If we've had too many consecutive failures, increase the update interval.
+            # The coordinator retries on its next scheduled refresh, so nothing
+            # waits here and the update slot is released immediately.
+            if self._consecutive_failures >= 5:
+                self.update_interval = max(self._base_interval, self._penalty_interval())
+            
+            self.data_ok = False
+            raise UpdateFailed(f"Kiln API error for {self.kiln_name}: {exc}") from exc
+        
+        self._reset_failures()
+        return self._snapshot(raw)
+
+    @callback
+    def async_set_fleet_data(self, data: dict[str, Any]) -> None:
+        """Take data for this kiln fetched by another coordinator on the account."""
+        self._reset_failures()
+        self.async_set_updated_data(self._snapshot(data))
+
+    def _snapshot(self, raw: dict[str, Any]) -> dict[str, Any]:
+        """Extract every sensor value from a raw response in one pass.
+
+        Sensors then read their value from the flat "values" dict instead of
+        each walking the nested response on every state write.
+        """
+        values: dict[str, Any] = {}
+        for key, getter, convert in _SENSOR_EXTRACTORS:
+            try:
+                value = getter(raw)
+            except (KeyError, TypeError):
+                # Value not present in this response
+                continue
+            if value is None:
+                continue
+            try:
+                values[key] = convert(value)
+            except (ValueError, TypeError) as exc:
+                _LOGGER.error("Failed to parse sensor %s for kiln %s: %s", 
+                             key, self.kiln_name, exc)
+        return {
+            "raw": raw,
+            "values": values,
+            "firmware": values.get("firmwareVersion"),
+        }
+
+    def get_device_info(self) -> DeviceInfo:
+        """Return device information about this kiln."""
+        firmware = self.data["firmware"] if self.data else None
+        if self._device_info is None or self._device_info.get("sw_version") != firmware:
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.serial_number)},
+                name=self.kiln_name or "Kiln",
+                manufacturer="Bartinst",
+                model="Kiln",
+                sw_version=firmware,
+                serial_number=self.serial_number,
+            )
+        return self._device_info
+
+    def _reset_failures(self) -> None:
+        """Reset failure counters and the refresh interval after a success."""
+        self.data_ok = True
+        self._consecutive_failures = 0
+        self._retries = 0
+        self._soft_failures = 0
+        self.update_interval = self._base_interval
+
+    def _penalty_interval(self) -> timedelta:
+        """Return the reduced-load refresh interval for the current failure streak."""
+        minutes = FAILURE_PENALTY_STEP * (self._consecutive_failures - 4)
+        return timedelta(minutes=min(FAILURE_PENALTY_MAX, minutes))
+
+    def _retry_delay(self) -> timedelta:
+        """Return the exponential backoff delay, with jitter, before the next retry."""
+        delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (self._retries - 1))
+        return timedelta(seconds=delay * (1 + random.random() * 0.5))
+
+
+class AuthExpired(UpdateFailed):
+    """Error to indicate the API rejected the authentication token."""
+
+
+class ConnectionFailed(UpdateFailed):
+    """Error to indicate the API could not be reached."""
+
+
+class RequestTimedOut(UpdateFailed):
+    """Error to indicate a request to the API timed out."""
+
+
+class SharedFetchFailed(UpdateFailed):
+    """Error to indicate another coordinator's fetch for the account just failed."""
+
+    def __init__(self, error: Exception | None) -> None:
+        """Initialize."""
+        super().__init__(str(error))
+        self.error = error
+
+
+class ServerError(UpdateFailed):
+    """Error to indicate the API returned a server error."""
+
+    def __init__(self, status: int) -> None:
+        """Initialize."""
+        super().__init__(f"Server error from Kiln API (status {status})")
+        self.status = status
@@ -16,7 +16,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SENSORS
+from .const import DOMAIN, SENSORS, SensorSpec
 from .coordinator import KilnDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,14 +34,8 @@ async def async_setup_entry(
     
     # Create sensors for each kiln
     for coordinator in coordinators:
-        for sensor_key, sensor_config in SENSORS.items():
-            sensors.append(
-                KilnSensor(
-                    coordinator=coordinator,
-                    sensor_key=sensor_key,
-                    sensor_config=sensor_config,
-                )
-            )
+        for spec in SENSORS:
+            sensors.append(KilnSensor(coordinator=coordinator, spec=spec))
         
         _LOGGER.info("Created %d sensors for kiln %s", 
                     len(SENSORS), coordinator.kiln_name)
@@ -55,82 +49,43 @@ class KilnSensor(CoordinatorEntity[KilnDataCoordinator], SensorEntity):
     def __init__(
         self,
         coordinator: KilnDataCoordinator,
-        sensor_key: str,
-        sensor_config: dict[str, Any],
+        spec: SensorSpec,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._sensor_key = sensor_key
-        self._sensor_config = sensor_config
+        self._spec = spec
         
         # Entity attributes - include kiln name for multiple kilns
         kiln_name = coordinator.kiln_name or "Kiln"
-        self._attr_name = f"{kiln_name} {sensor_config['name']}"
-        self._attr_unique_id = f"{coordinator.serial_number}_{sensor_key}"
-        self._attr_native_unit_of_measurement = sensor_config["unit"]
+        self._attr_name = f"{kiln_name} {spec.name}"
+        self._attr_unique_id = f"{coordinator.serial_number}_{spec.key}"
+        self._attr_native_unit_of_measurement = spec.unit
         
         # Set device class if specified
-        if sensor_config["device_class"] == "temperature":
+        if spec.device_class == "temperature":
             self._attr_device_class = SensorDeviceClass.TEMPERATURE
             self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
         
         # Set state class if specified
-        if sensor_config["state_class"] == "measurement":
+        if spec.state_class == "measurement":
             self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif sensor_config["state_class"] == "total":
+        elif spec.state_class == "total":
             self._attr_state_class = SensorStateClass.TOTAL
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this kiln."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.serial_number)},
-            name=self.coordinator.kiln_name or "Kiln",
-            manufacturer="Bartinst",
-            model="Kiln",
-            sw_version=self._get_firmware_version(),
-            serial_number=self.coordinator.serial_number,
-        )
+        return self.coordinator.get_device_info()
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-            
-        try:
-            # Navigate through the data path
-            data = self.coordinator.data
-            for key in self._sensor_config["data_path"]:
-                data = data.get(key, {})
-            
-            # Convert to the specified type if value exists
-            if data is not None:
-                value_type = self._sensor_config["value_type"]
-                if value_type == float:
-                    return float(data)
-                elif value_type == int:
-                    return int(data)
-                else:
-                    return str(data)
-            
-            return None
-            
-        except (KeyError, ValueError, TypeError) as exc:
-            _LOGGER.error("Failed to parse sensor %s for kiln %s: %s", 
-                         self._sensor_key, self.coordinator.kiln_name, exc)
+        if not self.coordinator.data_ok:
             return None
+        # Values are extracted and converted once per update by the coordinator
+        return self.coordinator.data["values"].get(self._spec.key)
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            self.coordinator.last_update_success 
-            and self.coordinator.data is not None
-        )
-
-    def _get_firmware_version(self) -> str | None:
-        """Get firmware version from data."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("settings", {}).get("firmwareVersion")
\ No newline at end of file
+        return self.coordinator.data_ok